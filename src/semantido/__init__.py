@@ -17,6 +17,9 @@ This module provides the core functionality for Semantido, including decorators,
 generators, and base classes for semantic data models.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from semantido.__version__ import __version__
 from semantido.decorators.semantic_table import semantic_table
 from semantido.generators.concept_registry import (
@@ -27,10 +30,34 @@ from semantido.generators.concept_registry import (
     MappingRelation,
     OntologySource,
 )
-from semantido.generators.semantic_bridge import SQLAlchemySemanticBridge
 from semantido.generators.semantic_layer import SemanticLayer
-from semantido.models.declarative_base import SemanticDeclarativeBase
-from semantido.models.semantic_base import SemanticBase
+
+if TYPE_CHECKING:
+    from semantido.generators.semantic_bridge import SQLAlchemySemanticBridge
+    from semantido.models.declarative_base import SemanticDeclarativeBase
+    from semantido.models.semantic_base import SemanticBase
+
+# Exports that pull in SQLAlchemy are resolved on first access (PEP 562), so
+# importing the package for the decorator or the concept registry alone does
+# not pay SQLAlchemy's import cost.
+_LAZY_EXPORTS = {
+    "SemanticBase": "semantido.models.semantic_base",
+    "SemanticDeclarativeBase": "semantido.models.declarative_base",
+    "SQLAlchemySemanticBridge": "semantido.generators.semantic_bridge",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "__version__",
@@ -15,11 +15,16 @@
 """Semantic layer JSON exporter"""
 
 import json
+from typing import Optional
 
 from semantido import SemanticLayer
 
 
-def to_json(semantic_layer: SemanticLayer, include_empty: bool = False) -> str:
+def to_json(
+    semantic_layer: SemanticLayer,
+    include_empty: bool = False,
+    indent: Optional[int] = 4,
+) -> str:
     """
     Export the semantic layer as a formatted JSON string.
 
@@ -27,15 +32,23 @@ def to_json(semantic_layer: SemanticLayer, include_empty: bool = False) -> str:
         semantic_layer: SemanticLayer built from SQLAlchemy models
         include_empty: Whether to include empty values in the JSON output,
         as some semantic layer values are optional and may not be present.
+        indent: Indentation for human-readable output. Pass None for
+            compact output, which uses the C-accelerated encoder and is
+            several times faster on large layers.
 
     Returns:
-            str: Indented JSON string representing the semantic layer.
+            str: JSON string representing the semantic layer.
     """
-    return json.dumps(semantic_layer.to_dict(include_empty=include_empty), indent=4)
+    return json.dumps(
+        semantic_layer.to_dict(include_empty=include_empty), indent=indent
+    )
 
 
 def to_json_file(
-    layer: SemanticLayer, file_path: str, include_empty: bool = False
+    layer: SemanticLayer,
+    file_path: str,
+    include_empty: bool = False,
+    indent: Optional[int] = 4,
 ) -> None:
     """
     Serializes and saves the semantic layer to a JSON file.
@@ -44,6 +57,10 @@ def to_json_file(
         layer: The SemanticLayer instance to export.
         file_path: The filesystem path where the JSON file will be created.
         include_empty: If False (default), removes null and empty collection values.
+        indent: Indentation for human-readable output; None writes compact JSON.
     """
+    # One dumps + write: json.dump feeds the file chunk by chunk from the
+    # pure-Python encoder even for compact output.
+    text = to_json(layer, include_empty=include_empty, indent=indent)
     with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(layer.to_dict(include_empty=include_empty), f, indent=4)
+        f.write(text)
@@ -150,10 +150,7 @@ def to_ossie_dict(
     referenced = {
         table.concept for table in semantic_layer.tables.values() if table.concept
     } | {
-        column.concept
-        for table in semantic_layer.tables.values()
-        for column in table.columns
-        if column.concept
+        column.concept for _, column in semantic_layer.iter_columns() if column.concept
     }
     if semantic_layer.concept_registry is not None and referenced:
         # Embed only the closure of referenced concepts, so a large
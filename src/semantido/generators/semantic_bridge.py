@@ -14,7 +14,21 @@
 
 """Extracts and synchronizes semantic metadata from SQLAlchemy models into a unified layer."""
 
-from typing import Optional, Type
+import sys
+from contextlib import contextmanager
+from dataclasses import fields
+from functools import partial
+from operator import attrgetter, itemgetter
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 from sqlalchemy import (
     DateTime,
@@ -37,10 +51,262 @@ from semantido.generators.utils.sqlalchemy_mapping import (
     extract_column_metadata,
     resolve_foreign_key,
     extract_table_metadata,
+    semantic_namespace,
+    extract_unique_keys,
 )
 
+# SQLAlchemy relationship direction name -> semantic cardinality
+_DIRECTION_MAP = {
+    "ONETOMANY": RelationshipType.ONE_TO_MANY,
+    "MANYTOONE": RelationshipType.MANY_TO_ONE,
+    "ONETOONE": RelationshipType.ONE_TO_ONE,
+    "MANYTOMANY": RelationshipType.MANY_TO_MANY,
+}
+
+_T = TypeVar("_T")
+
+
+class _SyncCache:
+    """
+    Values derived from SQLAlchemy objects, carried from one sync to the next.
+
+    Entries are keyed by the ``id()`` of their source objects and keep those
+    objects alongside the value, so an id recycled by a new object never
+    hits. Every rebuild starts a new generation: only entries looked up
+    during it survive, releasing whatever belonged to dropped models.
+    """
+
+    __slots__ = ("_previous", "_current")
+
+    def __init__(self) -> None:
+        self._previous: dict[tuple[int, ...], tuple[tuple, Any]] = {}
+        self._current: dict[tuple[int, ...], tuple[tuple, Any]] = {}
+
+    def rotate(self) -> None:
+        """Starts a new generation; call once at the start of each rebuild."""
+        self._previous, self._current = self._current, {}
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        self._previous, self._current = {}, {}
+
+    def get(self, sources: tuple, build: Callable[[], _T]) -> _T:
+        """Returns the value cached for ``sources``, building it on a miss."""
+        key = tuple(id(source) for source in sources)
+        hit = self._current.get(key) or self._previous.get(key)
+        # Identity, not ==: SQLAlchemy columns overload == into SQL expressions.
+        if hit is None or any(a is not b for a, b in zip(hit[0], sources)):
+            hit = (sources, build())
+        self._current[key] = hit
+        return hit[1]
+
+
+def _extract_table(
+    clazz: Type,
+    mapper,
+    table_name: str,
+    namespace: dict,
+    column_cache: _SyncCache,
+) -> Table:
+    """
+    Transforms an SQLAlchemy mapped class into a semantic Table definition.
+
+    Args:
+        clazz: The Python class representing the model.
+        mapper: The SQLAlchemy Mapper object containing low-level schema info.
+        table_name: The mapper's physical table name.
+        namespace: The class namespace from ``semantic_namespace``.
+        column_cache: Column metadata carried over from the previous sync.
+
+    Returns:
+        Table: A semantic representation of the table and its metadata.
+    """
+    schema = mapper.persist_selectable.schema
+    schema = str(schema) if schema else None
+    meta = extract_table_metadata(clazz, table_name, namespace)
+
+    # time dimension if declared must be of a Date or DateTime type
+    time_dimension = meta["time_dimension"]
+    if time_dimension is not None:
+        if time_dimension not in mapper.columns:
+            raise ValueError(
+                f"{clazz.__name__} time dimension: {time_dimension} "
+                f"must be a column in the table"
+            )
+
+        if not isinstance(mapper.columns[time_dimension].type, (Date, DateTime)):
+            raise ValueError(
+                f"{clazz.__name__} time dimension: {time_dimension} "
+                f"must be of a Date or DateTime type"
+            )
+
+    primary_key = [key.name for key in mapper.primary_key] or None
+    unique_keys = extract_unique_keys(mapper, primary_key)
+
+    columns = []
+
+    # Keys are the mapped attribute names, which the semantic annotations
+    # (<attr>_description, ...) are written against; Column.key is the
+    # SQL column key and differs for e.g. ``user_name = Column("username")``.
+    for name, prop in mapper.columns.items():
+        column = _extract_column(clazz, name, prop, namespace, column_cache)
+        if name == time_dimension:
+            column.is_time_dimension = True
+        columns.append(column)
+
+    return Table(
+        name=table_name,
+        description=meta["description"],
+        columns=columns,
+        primary_key=primary_key,
+        unique_keys=unique_keys,
+        schema=schema,
+        synonyms=meta["synonyms"],
+        sql_filters=meta["sql_filters"],
+        application_context=meta["application_context"],
+        business_context=meta["business_context"],
+        time_dimension=meta["time_dimension"],
+        concept=meta["concept"],
+    )
+
+
+def _extract_column(
+    clazz: Type,
+    column_name: str,
+    prop,
+    namespace: dict,
+    column_cache: _SyncCache,
+) -> Column:
+    """
+    Extracts semantic metadata and schema info for a specific column.
+
+    Time metadata contract:
+        <col>._is_time_dimension: bool marks a (secondary) business time axis
+        The table PRIMARY axis is declared once on the table decorator, and it's
+        applied by _extract_table
+        <col>_time_grain accepts a TimeGrain enum, and declaring a grain lower than
+        the table e.g., HOUR on a DATE column will emit a UserWarning
+
+    Args:
+        clazz: The model class where the column is defined.
+        column_name: The name of the column attribute.
+        prop: The SQLAlchemy column metadata or property.
+        namespace: The class namespace from ``semantic_namespace``,
+            shared across the columns of one table.
+        column_cache: Column metadata carried over from the previous sync.
+            Keyed on the class and the SQLAlchemy column, so a rebuild
+            triggered by another model reuses this column's metadata.
+
+    Returns:
+        Column: The semantic Column object.
+    """
+
+    def build() -> dict:
+        meta = extract_column_metadata(clazz, column_name, namespace)
+
+        # value check for time grain for duration inconsistencies
+        if meta["time_grain"] is not None:
+            check_grain_supported_by_type(
+                clazz, column_name, meta["time_grain"], prop.type
+            )
+
+        is_fk, references = resolve_foreign_key(prop)
+        meta.update(
+            data_type=map_sqlalchemy_type(prop.type),
+            is_foreign_key=is_fk,
+            references=references,
+        )
+        return meta
+
+    meta = column_cache.get((clazz, prop), build)
+
+    # A fresh Column per sync: callers may mutate the layer they are handed.
+    return Column(name=column_name, **meta)
+
+
+def _named_mappers(mappers: FrozenSet) -> list[tuple[str, Any]]:
+    """
+    Pairs each mapper with its table name, sorted by name.
+
+    registry.mappers is a frozenset, so its iteration order varies across
+    processes (hash randomization); sorting by table name keeps exports
+    deterministic and diffable. Each table name is read once and handed to
+    both extractors. Names are interned: every relationship endpoint naming
+    the same table then shares one string, and layer lookups by name
+    compare by identity first.
+
+    Args:
+        mappers: The registry mappers.
+
+    Returns:
+        list: ``(table name, mapper)`` pairs in table name order.
+    """
+    return sorted(
+        (
+            (sys.intern(str(mapper.persist_selectable.name)), mapper)
+            for mapper in mappers
+        ),
+        key=itemgetter(0),
+    )
+
+
+# Field values in declaration order, so a copy is one constructor call
+# plus its mutable containers (copy.copy goes through __reduce_ex__ and
+# costs several times as much per object).
+_COLUMN_VALUES = attrgetter(*(field.name for field in fields(Column)))
+_TABLE_VALUES = attrgetter(*(field.name for field in fields(Table)))
+_RELATIONSHIP_VALUES = attrgetter(*(field.name for field in fields(Relationship)))
+
+
+def _copy_list(values: Optional[Iterable]) -> Optional[list]:
+    """Returns a new list of ``values``, keeping None as None."""
+    return None if values is None else list(values)
+
+
+def _copy_column(column: Column) -> Column:
+    """Copies a cached column, including its list fields."""
+    duplicate = Column(*_COLUMN_VALUES(column))
+    # Inlined rather than via _copy_list: this runs once per column per sync
+    values = column.sample_values
+    duplicate.sample_values = None if values is None else list(values)
+    values = column.synonyms
+    duplicate.synonyms = None if values is None else list(values)
+    values = column.application_rules
+    duplicate.application_rules = None if values is None else list(values)
+    return duplicate
+
+
+def _copy_table(table: Table) -> Table:
+    """
+    Copies a cached table so edits to the copy never reach the cache.
+
+    Every mutable container is copied too, down to the columns' list
+    fields: callers filtering a layer per request rebind, trim or append
+    to them. The strings and enum members inside are shared.
+
+    Args:
+        table: The cached table.
+
+    Returns:
+        Table: An independent copy of the table.
+    """
+    duplicate = Table(*_TABLE_VALUES(table))
+    duplicate.columns = [_copy_column(column) for column in table.columns]
+    duplicate.primary_key = _copy_list(table.primary_key)
+    if table.unique_keys is not None:
+        duplicate.unique_keys = [list(key) for key in table.unique_keys]
+    duplicate.synonyms = _copy_list(table.synonyms)
+    duplicate.sql_filters = _copy_list(table.sql_filters)
+    return duplicate
+
+
+def _copy_relationship(relationship: Relationship) -> Relationship:
+    """Copies a cached relationship; all its fields are immutable."""
+    return Relationship(*_RELATIONSHIP_VALUES(relationship))
+
 
 class SQLAlchemySemanticBridge:
+    # pylint: disable=R0902
     """
     Bridge between SQLAlchemy models and the semantic layer.
 
@@ -48,30 +314,107 @@ class SQLAlchemySemanticBridge:
     registry to generate a structured `SemanticLayer`. It handles the conversion of
     SQL types to normalized types, builds join conditions for relationships, and
     retrieves semantic metadata attached via decorators.
+
+    Extracted tables and relationships are cached against a fingerprint of
+    the SQLAlchemy registry (the set of mappers it holds), so repeated syncs
+    against an unchanged model set skip re-extraction. The cache itself is
+    never handed out: every sync returns a new layer holding copies.
     """
 
+    __slots__ = (
+        "base",
+        "semantic_layer",
+        "_model_registry",
+        "_layer_fingerprint",
+        "_tables",
+        "_relationships",
+        "_schema_frozen",
+        "_join_conditions",
+        "_column_metadata",
+    )
+
     def __init__(self, base):
         self.base = base
         self.semantic_layer = SemanticLayer()
         self._model_registry: dict[str, Type] = {}
+        self._layer_fingerprint: Optional[FrozenSet] = None
+        self._tables: list[Table] = []
+        self._relationships: list[Relationship] = []
+        self._schema_frozen = 0
+        self._join_conditions = _SyncCache()
+        self._column_metadata = _SyncCache()
 
     def get_semantic_layer(self) -> SemanticLayer:
         """
-        Retrieves the current semantic layer instance.
+        Retrieves the layer returned by the most recent sync.
 
         Returns:
             SemanticLayer: The object containing extracted table and relationship metadata.
         """
         return self.semantic_layer
 
+    @contextmanager
+    def caching_schema(self) -> Iterator["SQLAlchemySemanticBridge"]:
+        """
+        Freezes the registry fingerprint for the duration of a block.
+
+        Inside the block, once the models have been extracted, further syncs
+        reuse the extraction without re-reading ``registry.mappers`` to detect model changes.
+        Intended for bursts of syncs (e.g. a batch of exports) where the
+        model set is known not to change. Blocks may be nested.
+
+        Yields:
+            SQLAlchemySemanticBridge: This bridge.
+
+        Examples:
+            ```python
+            with bridge.caching_schema():
+                for registry in registries:
+                    export(bridge.sync_from_models(concept_registry=registry))
+            ```
+        """
+        self._schema_frozen += 1
+        try:
+            yield self
+        finally:
+            self._schema_frozen -= 1
+
+    def invalidate(self) -> None:
+        """
+        Discards the cached extraction and the metadata reused across rebuilds.
+
+        The cache only notices models being mapped or dropped. Call this
+        after editing semantic annotations on an already-mapped class so
+        the next sync re-extracts everything.
+        """
+        self._layer_fingerprint = None
+        self._join_conditions.clear()
+        self._column_metadata.clear()
+
+    def _registry_fingerprint(self) -> FrozenSet:
+        """Returns the key the cached extraction is valid for.
+
+        ``registry.mappers`` is rebuilt on each access, so the resulting
+        frozenset changes whenever a model is mapped into (or dropped from)
+        the registry.
+        """
+        if self._schema_frozen and self._layer_fingerprint is not None:
+            return self._layer_fingerprint
+        return self.base.registry.mappers
+
     def sync_from_models(
-        self, concept_registry: Optional[ConceptRegistry] = None
+        self,
+        concept_registry: Optional[ConceptRegistry] = None,
+        only: Optional[Iterable[str]] = None,
     ) -> SemanticLayer:
         """
         Extracts schema and semantic information from all mapped models.
 
-        This method clears any previously cached metadata and performs a full scan
-        of the SQLAlchemy registry to rebuild the semantic layer.
+        When the registry holds the same mappers as on the previous sync,
+        the cached extraction is reused. Otherwise a full scan of the
+        SQLAlchemy registry rebuilds it. Either way the caller gets a new
+        layer of copied tables, columns and relationships, so filtering it
+        in place never affects later syncs.
 
         Args:
             concept_registry: Optional registry the models' concept
@@ -79,38 +422,165 @@ class SQLAlchemySemanticBridge:
                 registry itself is validated first, then every
                 ``concept=...`` / ``<column>_concept`` reference must
                 resolve to a registered concept id — unknown references
-                fail the sync (same policy as ``time_dimension``).
+                fail the sync (same policy as ``time_dimension``). Checked
+                on every call, so in-place registry edits are caught.
+            only: Optional table names to limit the sync to. Models mapped
+                to other tables are skipped, as are relationships pointing
+                at them; ``None`` syncs every mapped model. A subset sync
+                returns a layer of its own and leaves the cached full
+                extraction and ``get_semantic_layer()`` untouched.
 
         Returns:
             SemanticLayer: The fully populated semantic layer.
+
+        Raises:
+            TypeError: If ``only`` is a single ``str``.
+            ValueError: If ``only`` names a table no mapped model uses.
         """
-        self.semantic_layer.tables.clear()
-        self.semantic_layer.relationships.clear()
-        self._model_registry.clear()
-
-        # Get all mapped classes. registry.mappers is a frozenset, so its
-        # iteration order varies across processes (hash randomization);
-        # sort by table name so exports are deterministic and diffable.
-        mappers = sorted(
-            self.base.registry.mappers,
-            key=lambda mapper: str(mapper.persist_selectable.name),
+        if isinstance(only, str):
+            raise TypeError(
+                f"only expects an iterable of table names, not a str: "
+                f"pass [{only!r}] to sync a single table"
+            )
+
+        fingerprint = self._registry_fingerprint()
+        if only is None:
+            if fingerprint != self._layer_fingerprint:
+                self._rebuild(fingerprint)
+            tables, relationships = self._tables, self._relationships
+        else:
+            tables, relationships = self._extract_subset(fingerprint, frozenset(only))
+
+        # The glossary is authored on the layer, not on the models, so it
+        # carries over from the previous sync like it did before caching.
+        layer = SemanticLayer(
+            application_glossary=dict(self.semantic_layer.application_glossary),
+            concept_registry=concept_registry,
         )
-        for mapper in mappers:
+        layer.bulk_load(
+            map(_copy_table, tables), map(_copy_relationship, relationships)
+        )
+        if concept_registry is not None:
+            concept_registry.validate()
+            self._validate_concept_references(layer, concept_registry)
+
+        # Subset layers are handed to the caller only: the bridge's layer
+        # stays the most recent full sync.
+        if only is None:
+            self.semantic_layer = layer
+        return layer
+
+    def _rebuild(self, fingerprint: FrozenSet) -> None:
+        """
+        Re-extracts every mapped model into the bridge's cache.
+
+        Args:
+            fingerprint: The registry mappers to extract.
+
+        Raises:
+            RuntimeError: If a model fails to extract; the previous
+                extraction is kept.
+        """
+        self._layer_fingerprint = None
+        self._join_conditions.rotate()
+        self._column_metadata.rotate()
+        tables, relationships, model_registry = self._extract_models(
+            _named_mappers(fingerprint)
+        )
+
+        # Publish the rebuilt extraction in one step: a failed extraction
+        # above leaves the previous one intact rather than half-cleared.
+        self._tables = tables
+        self._relationships = relationships
+        self._model_registry = model_registry
+        self._layer_fingerprint = fingerprint
+
+    def _extract_subset(
+        self, fingerprint: FrozenSet, only_tables: FrozenSet[str]
+    ) -> tuple[list[Table], list[Relationship]]:
+        """
+        Extracts the models mapped to ``only_tables``, leaving the cache alone.
+
+        A current cached extraction is filtered; otherwise only the named
+        models are extracted, bounding the work by the subset's size.
+
+        Args:
+            fingerprint: The registry mappers to pick the subset from.
+            only_tables: The table names to keep.
+
+        Returns:
+            tuple: The subset's tables and the relationships between them.
+
+        Raises:
+            ValueError: If ``only_tables`` names a table no mapped model uses.
+        """
+        named_mappers = _named_mappers(fingerprint)
+        unknown = only_tables.difference(name for name, _ in named_mappers)
+        if unknown:
+            raise ValueError(
+                f"No mapped model for table(s): {', '.join(sorted(unknown))}"
+            )
+
+        if fingerprint == self._layer_fingerprint:
+            tables = [table for table in self._tables if table.name in only_tables]
+            relationships = self._relationships
+        else:
+            tables, relationships, _ = self._extract_models(
+                [
+                    (name, mapper)
+                    for name, mapper in named_mappers
+                    if name in only_tables
+                ]
+            )
+        return tables, [
+            relationship
+            for relationship in relationships
+            if relationship.from_table in only_tables
+            and relationship.to_table in only_tables
+        ]
+
+    def _extract_models(
+        self, named_mappers: list[tuple[str, Any]]
+    ) -> tuple[list[Table], list[Relationship], dict[str, Type]]:
+        """
+        Extracts tables and relationships for the given mappers.
+
+        Args:
+            named_mappers: ``(table name, mapper)`` pairs, in layer order.
+
+        Returns:
+            tuple: The tables, the relationships and the table name to
+            mapped class registry.
+
+        Raises:
+            RuntimeError: Naming the model that failed to extract.
+        """
+        tables: list[Table] = []
+        relationships: list[Relationship] = []
+        model_registry: dict[str, Type] = {}
+
+        for table_name, mapper in named_mappers:
             clazz = mapper.class_
-            table_name = str(mapper.persist_selectable.name)
 
             # Add the current mapped table to the model registry
-            self._model_registry[table_name] = clazz
+            model_registry[table_name] = clazz
 
             try:
+                # One merged MRO namespace serves every table, column and
+                # relationship annotation lookup for this class
+                namespace = semantic_namespace(clazz)
+
                 # Extract table information
-                table = self._extract_table(clazz, mapper)
-                self.semantic_layer.add_table(table)
+                tables.append(
+                    _extract_table(
+                        clazz, mapper, table_name, namespace, self._column_metadata
+                    )
+                )
 
                 # Extract table relationships
-                relationships = self._extract_relationships(clazz, mapper)
-                for relationship in relationships:
-                    self.semantic_layer.add_relationship(relationship)
+                relationships.extend(
+                    self._extract_relationships(mapper, table_name, namespace)
+                )
 
             except Exception as exc:
                 raise RuntimeError(
@@ -118,27 +588,25 @@ class SQLAlchemySemanticBridge:
                     f"'{clazz.__name__}' (table: '{table_name}')"
                 ) from exc
 
-        self.semantic_layer.concept_registry = concept_registry
-        if concept_registry is not None:
-            concept_registry.validate()
-            self._validate_concept_references(concept_registry)
+        return tables, relationships, model_registry
 
-        return self.semantic_layer
-
-    def _validate_concept_references(self, registry: ConceptRegistry) -> None:
+    def _validate_concept_references(
+        self, layer: SemanticLayer, registry: ConceptRegistry
+    ) -> None:
         """Checks that every declared concept reference resolves.
 
         Collects all unknown references across the layer and raises once,
         so a failing sync reports every dangling reference.
 
         Args:
+            layer: The layer whose references are checked.
             registry: The concept registry to resolve against.
 
         Raises:
             ValueError: Listing every unresolved concept reference.
         """
         unknown: list[str] = []
-        for table in self.semantic_layer.tables.values():
+        for table in layer.tables.values():
             if table.concept and table.concept not in registry.concepts:
                 unknown.append(f"table '{table.name}' -> {table.concept!r}")
             for column in table.columns:
@@ -152,149 +620,9 @@ class SQLAlchemySemanticBridge:
                 + "\n  - ".join(unknown)
             )
 
-    @staticmethod
-    def _extract_table(clazz: Type, mapper) -> Table:
-        """
-        Transforms an SQLAlchemy mapped class into a semantic Table definition.
-
-        Args:
-            clazz: The Python class representing the model.
-            mapper: The SQLAlchemy Mapper object containing low-level schema info.
-
-        Returns:
-            Table: A semantic representation of the table and its metadata.
-        """
-        table_name = str(mapper.persist_selectable.name)
-        schema = (
-            str(mapper.persist_selectable.schema)
-            if mapper.persist_selectable.schema
-            else None
-        )
-        meta = extract_table_metadata(clazz, table_name)
-
-        # time dimension if declared must be of a Date or DateTime type
-        time_dimension = meta["time_dimension"]
-        if time_dimension is not None:
-            if time_dimension not in mapper.columns:
-                raise ValueError(
-                    f"{clazz.__name__} time dimension: {time_dimension} "
-                    f"must be a column in the table"
-                )
-
-            if not isinstance(mapper.columns[time_dimension].type, (Date, DateTime)):
-                raise ValueError(
-                    f"{clazz.__name__} time dimension: {time_dimension} "
-                    f"must be of a Date or DateTime type"
-                )
-
-        primary_key = [key.name for key in mapper.primary_key] or None
-        unique_keys = SQLAlchemySemanticBridge._extract_unique_keys(mapper, primary_key)
-
-        columns = []
-
-        for name, prop in mapper.columns.items():
-            name = str(name)
-            column = SQLAlchemySemanticBridge._extract_column(clazz, name, prop)
-            if name == meta["time_dimension"]:
-                column.is_time_dimension = True
-            columns.append(column)
-
-        return Table(
-            name=table_name,
-            description=meta["description"],
-            columns=columns,
-            primary_key=primary_key,
-            unique_keys=unique_keys,
-            schema=schema,
-            synonyms=meta["synonyms"],
-            sql_filters=meta["sql_filters"],
-            application_context=meta["application_context"],
-            business_context=meta["business_context"],
-            time_dimension=meta["time_dimension"],
-            concept=meta["concept"],
-        )
-
-    @staticmethod
-    def _extract_unique_keys(mapper, primary_key) -> list[list[str]] | None:
-        """Extracts unique constraints and unique indexes as key column lists.
-
-        Covers ``UniqueConstraint`` in ``__table_args__``, the implicit
-        constraint created by ``Column(unique=True)``, and ``Index(...,
-        unique=True)``. The primary key is excluded (it is already declared
-        via ``primary_key``), duplicates are collapsed, and the result is
-        sorted for deterministic output.
-
-        Declaring these matters downstream: Apache Ossie cardinality inference
-        (Foundation section 6.4) treats join columns with no declared key as
-        worst-case N:N, so dropping a unique key silently restricts the
-        query surface of every relationship targeting those columns.
-        """
-        # pylint: disable=C0415
-        from sqlalchemy import UniqueConstraint
-
-        table = mapper.persist_selectable
-        keys: set[tuple[str, ...]] = set()
-
-        for constraint in getattr(table, "constraints", ()):
-            if isinstance(constraint, UniqueConstraint):
-                keys.add(tuple(col.name for col in constraint.columns))
-
-        for index in getattr(table, "indexes", ()):
-            if getattr(index, "unique", False):
-                keys.add(tuple(col.name for col in index.columns))
-
-        if primary_key:
-            keys.discard(tuple(primary_key))
-
-        return [list(key) for key in sorted(keys)] or None
-
-    @staticmethod
-    def _extract_column(clazz: Type, column_name: str, prop) -> Column:
-        """
-        Extracts semantic metadata and schema info for a specific column.
-
-        Time metadata contract:
-            <col>._is_time_dimension: bool marks a (secondary) business time axis
-            The table PRIMARY axis is declared once on the table decorator, and it's
-            applied by _extract_table
-            <col>_time_grain accepts a TimeGrain enum, and declaring a grain lower than
-            the table e.g., HOUR on a DATE column will emit a UserWarning
-
-        Args:
-            clazz: The model class where the column is defined.
-            column_name: The name of the column attribute.
-            prop: The SQLAlchemy column metadata or property.
-
-        Returns:
-            Column: The semantic Column object.
-        """
-        meta = extract_column_metadata(clazz, column_name)
-        data_type = map_sqlalchemy_type(prop.type)
-        is_fk, references = resolve_foreign_key(prop)
-
-        # value check for time grain for duration inconsistencies
-        if meta["time_grain"] is not None:
-            check_grain_supported_by_type(
-                clazz, column_name, meta["time_grain"], prop.type
-            )
-
-        return Column(
-            name=column_name,
-            data_type=data_type,
-            description=meta["description"],
-            privacy_level=meta["privacy_level"],
-            sample_values=meta["sample_values"],
-            synonyms=meta["synonyms"],
-            is_foreign_key=is_fk,
-            references=references,
-            application_rules=meta["application_rules"],
-            is_time_dimension=meta["is_time_dimension"],
-            time_grain=meta["time_grain"],
-            concept=meta["concept"],
-        )
-
-    @staticmethod
-    def _extract_relationships(clazz, mapper) -> list[Relationship]:
+    def _extract_relationships(
+        self, mapper, source_table: str, namespace: dict
+    ) -> list[Relationship]:
         """Inspects an SQLAlchemy mapped class and its mapper to extract
          semantic relationship metadata.
 
@@ -303,41 +631,39 @@ class SQLAlchemySemanticBridge:
         builds the SQL join conditions, and retrieves any custom descriptions defined on the class.
 
         Args:
-            clazz: The SQLAlchemy model class to inspect.
             mapper: The SQLAlchemy Mapper object associated with the class.
+            source_table: The mapper's physical table name.
+            namespace: The mapped class namespace from ``semantic_namespace``.
 
         Returns:
             list: A list of Relationship objects representing the semantic links to other tables.
         """
-
-        _direction_map = {
-            "ONETOMANY": RelationshipType.ONE_TO_MANY,
-            "MANYTOONE": RelationshipType.MANY_TO_ONE,
-            "ONETOONE": RelationshipType.ONE_TO_ONE,
-            "MANYTOMANY": RelationshipType.MANY_TO_MANY,
-        }
-
         relationships = []
         for relationship_name, relationship_meta in mapper.relationships.items():
             target = relationship_meta.mapper
-            target_table = str(target.persist_selectable.name)
-            source_table = str(mapper.persist_selectable.name)
+            target_table = sys.intern(str(target.persist_selectable.name))
 
             direction_name = relationship_meta.direction.name
 
-            relationship_type = _direction_map.get(relationship_meta.direction.name)
+            relationship_type = _DIRECTION_MAP.get(direction_name)
             if relationship_type is None:
                 raise ValueError(
                     f"Unknown relationship direction '{direction_name}' "
                     f"for relationship '{relationship_name}' on '{source_table}'"
                 )
 
-            join_condition = build_join_condition(relationship_meta)
+            # local/remote pairs are fixed once the relationship is configured,
+            # so a rebuild triggered by another model reuses the condition
+            join_condition = self._join_conditions.get(
+                (relationship_meta,),
+                partial(build_join_condition, relationship_meta),
+            )
 
-            description = getattr(
-                clazz,
-                f"{relationship_name}_relationship_description",
-                f"Relationship between {source_table} and {target_table}",
+            description_key = relationship_name + "_relationship_description"
+            description = (
+                namespace[description_key]
+                if description_key in namespace
+                else f"Relationship between {source_table} and {target_table}"
             )
 
             relationships.append(
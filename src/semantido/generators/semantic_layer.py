@@ -15,12 +15,17 @@
 """Defines the data structures for the semantic representation of the database schema."""
 
 from enum import Enum
-from typing import Optional, Any
+from typing import Any, Callable, Iterable, Iterator, Optional
 from dataclasses import dataclass, field
 
 from semantido.generators.concept_registry import ConceptRegistry
 
 
+def _keep_as_is(row: dict) -> dict:
+    """Identity pruning step for ``SemanticLayer.to_dict(include_empty=True)``."""
+    return row
+
+
 class PrivacyLevel(Enum):
     """
     Defines the data sensitivity levels for columns.
@@ -72,7 +77,32 @@ class RelationshipType(Enum):
     MANY_TO_MANY = "many-to-many"
 
 
-@dataclass
+class _EnumValues(dict[Optional[Enum], Any]):
+    """
+    Serialized form of each member of an enum, read by to_dict with one get.
+
+    None maps to None, so optional fields need no branch. The dataclasses
+    coerce raw values on construction, but a field assigned afterwards
+    (e.g. ``column.privacy_level = "public"``) misses the table and is
+    serialized the way a member's ``.value`` would be, or as-is.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, enum: type[Enum]):
+        values: dict[Optional[Enum], Any] = {member: member.value for member in enum}
+        super().__init__({None: None, **values})
+
+    def __missing__(self, value: Any) -> Any:
+        return value.value if isinstance(value, Enum) else value
+
+
+_PRIVACY_VALUES = _EnumValues(PrivacyLevel)
+_TIME_GRAIN_VALUES = _EnumValues(TimeGrain)
+_RELATIONSHIP_VALUES = _EnumValues(RelationshipType)
+
+
+@dataclass(slots=True)
 class Column:
     # pylint: disable=R0902
     """
@@ -107,8 +137,18 @@ class Column:
     # Concept tier (v0.4.0): id of the registered concept this column realizes
     concept: Optional[str] = None
 
+    def __post_init__(self):
+        # Accept the enum values ("confidential", "day") as well as members,
+        # so serializers can rely on the member's ``.value``.
+        if self.privacy_level is not None and not isinstance(
+            self.privacy_level, PrivacyLevel
+        ):
+            self.privacy_level = PrivacyLevel(self.privacy_level)
+        if self.time_grain is not None and not isinstance(self.time_grain, TimeGrain):
+            self.time_grain = TimeGrain(self.time_grain)
+
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     # pylint: disable=R0902
     """
@@ -151,8 +191,20 @@ class Table:
     # Concept tier (v0.4.0): id of the registered concept this table realizes
     concept: Optional[str] = None
 
+    def get_column(self, name: str) -> Optional[Column]:
+        """
+        Looks up a column of this table by name.
+
+        Args:
+            name: The column name.
+
+        Returns:
+            Optional[Column]: The first column with that name, or None.
+        """
+        return next((column for column in self.columns if column.name == name), None)
 
-@dataclass
+
+@dataclass(slots=True)
 class Relationship:
     """
     Represents a semantic link between two database tables.
@@ -173,8 +225,12 @@ class Relationship:
     )
     description: str
 
+    def __post_init__(self):
+        if not isinstance(self.relationship_type, RelationshipType):
+            self.relationship_type = RelationshipType(self.relationship_type)
+
 
-@dataclass
+@dataclass(slots=True)
 class SemanticLayer:
     """
     The central repository for all semantic metadata extracted from the database.
@@ -208,10 +264,58 @@ class SemanticLayer:
         """
         self.relationships.append(relationship)
 
+    def bulk_load(self, tables: Iterable[Table], relationships: Iterable[Relationship]):
+        """
+        Replaces the layer's tables and relationships in a single step.
+
+        Both collections are built before either is assigned, so readers
+        never observe new tables paired with stale relationships.
+
+        Args:
+            tables: The Table objects, keyed by name in the resulting layer.
+            relationships: The Relationship objects, in order.
+        """
+        self.tables = {table.name: table for table in tables}
+        self.relationships = list(relationships)
+
+    def iter_columns(self) -> Iterator[tuple[Table, Column]]:
+        """
+        Iterates every column of every table in one flat pass.
+
+        Layer-wide column scans (e.g. all columns bound to a concept, all
+        confidential columns) read as a single filter over this iterator
+        instead of a nested table/column loop.
+
+        Yields:
+            tuple[Table, Column]: Each column with the table it belongs to,
+            in table then column order.
+        """
+        for table in self.tables.values():
+            for column in table.columns:
+                yield table, column
+
+    def relationships_by_source(self) -> dict[str, list[Relationship]]:
+        """
+        Groups relationships by the table they start from, in one pass.
+
+        ``relationships`` stays a list because two tables may be linked more
+        than once (e.g. a trade's buyer and seller both referencing
+        counterparties). Graph walks build this index once and then look up
+        a table's outgoing links directly instead of rescanning the list.
+
+        Returns:
+            dict[str, list[Relationship]]: ``from_table`` to its
+            relationships, in layer order.
+        """
+        by_source: dict[str, list[Relationship]] = {}
+        for relationship in self.relationships:
+            by_source.setdefault(relationship.from_table, []).append(relationship)
+        return by_source
+
     @staticmethod
     def _remove_empty_values(obj):
         """
-        Recursively removes keys with None, empty lists, or empty dicts from a dictionary.
+        Recursively removes keys with None, empty lists, tuples, or dicts from a dictionary.
         This helps produce cleaner JSON output by eliminating null and empty collection values.
 
         Args:
@@ -222,16 +326,24 @@ class SemanticLayer:
         """
         if isinstance(obj, dict):
             return {
-                k: SemanticLayer._remove_empty_values(v)
+                k: (
+                    SemanticLayer._remove_empty_values(v)
+                    if isinstance(v, (dict, list))
+                    else v
+                )
                 for k, v in obj.items()
-                if v is not None and v != [] and v != {}
+                if v is not None and v != [] and v != {} and v != ()
             }
 
         if isinstance(obj, list):
             return [
-                SemanticLayer._remove_empty_values(item)
+                (
+                    SemanticLayer._remove_empty_values(item)
+                    if isinstance(item, (dict, list))
+                    else item
+                )
                 for item in obj
-                if item is not None and item != [] and item != {}
+                if item is not None and item != [] and item != {} and item != ()
             ]
 
         return obj
@@ -247,73 +359,78 @@ class SemanticLayer:
         Returns:
             dict: A dictionary representation suitable for JSON serialization.
         """
+        # Each table and relationship is pruned as soon as it is built, so
+        # only one tree is ever materialized instead of a raw and a cleaned
+        # copy side by side.
+        prune: Callable[[dict], dict] = (
+            _keep_as_is if include_empty else self._remove_empty_values
+        )
         raw_dict = {
             "tables": {
-                name: {
-                    "name": table.name,
-                    "description": table.description,
-                    "primary_key": table.primary_key,
-                    "unique_keys": table.unique_keys,
-                    "schema": table.schema,
-                    "synonyms": table.synonyms,
-                    "sql_filters": table.sql_filters,
-                    "application_context": table.application_context,
-                    "business_context": table.business_context,
-                    "time_dimension": table.time_dimension,
-                    "concept": table.concept,
-                    "columns": [
-                        {
-                            "name": column.name,
-                            "data_type": column.data_type,
-                            "description": column.description,
-                            "privacy_level": (
-                                column.privacy_level.value
-                                if isinstance(column.privacy_level, Enum)
-                                else column.privacy_level
-                            ),
-                            "sample_values": column.sample_values,
-                            "synonyms": column.synonyms,
-                            "is_foreign_key": column.is_foreign_key,
-                            "references": column.references,
-                            "application_rules": column.application_rules,
-                            "is_time_dimension": column.is_time_dimension or None,
-                            "time_grain": (
-                                column.time_grain.value
-                                if isinstance(column.time_grain, Enum)
-                                else column.time_grain
-                            ),
-                            "concept": column.concept,
-                        }
-                        for column in table.columns
-                    ],
-                }
+                name: prune(
+                    {
+                        "name": table.name,
+                        "description": table.description,
+                        "primary_key": table.primary_key,
+                        "unique_keys": table.unique_keys,
+                        "schema": table.schema,
+                        "synonyms": table.synonyms,
+                        "sql_filters": table.sql_filters,
+                        "application_context": table.application_context,
+                        "business_context": table.business_context,
+                        "time_dimension": table.time_dimension,
+                        "concept": table.concept,
+                        "columns": [
+                            {
+                                "name": column.name,
+                                "data_type": column.data_type,
+                                "description": column.description,
+                                "privacy_level": _PRIVACY_VALUES[column.privacy_level],
+                                "sample_values": column.sample_values,
+                                "synonyms": column.synonyms,
+                                "is_foreign_key": column.is_foreign_key,
+                                "references": column.references,
+                                "application_rules": column.application_rules,
+                                "is_time_dimension": column.is_time_dimension or None,
+                                "time_grain": _TIME_GRAIN_VALUES[column.time_grain],
+                                "concept": column.concept,
+                            }
+                            for column in table.columns
+                        ],
+                    }
+                )
                 for name, table in self.tables.items()
             },
             "relationships": [
-                {
-                    "from_table": relationship.from_table,
-                    "to_table": relationship.to_table,
-                    "join_condition": relationship.join_condition,
-                    "relationship_type": (
-                        relationship.relationship_type.value
-                        if isinstance(relationship.relationship_type, Enum)
-                        else relationship.relationship_type
-                    ),
-                    "description": relationship.description,
-                }
+                prune(
+                    {
+                        "from_table": relationship.from_table,
+                        "to_table": relationship.to_table,
+                        "join_condition": relationship.join_condition,
+                        "relationship_type": _RELATIONSHIP_VALUES[
+                            relationship.relationship_type
+                        ],
+                        "description": relationship.description,
+                    }
+                )
                 for relationship in self.relationships
             ],
         }
 
         if self.concept_registry is not None:
-            raw_dict["concepts"] = self.concept_registry.to_dict()
+            concepts = self.concept_registry.to_dict()
+            if concepts or include_empty:
+                raw_dict["concepts"] = prune(concepts)
 
         if include_empty:
             return raw_dict
 
-        cleaned = self._remove_empty_values(raw_dict)
-
+        # Keep the key order of pruning the whole tree at once: an empty
+        # tables or relationships collection drops out, then comes back
+        # after concepts.
+        cleaned = {
+            key: value for key, value in raw_dict.items() if value or key == "concepts"
+        }
         cleaned.setdefault("tables", {})
         cleaned.setdefault("relationships", [])
-
         return cleaned
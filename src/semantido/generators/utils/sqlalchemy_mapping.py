@@ -14,71 +14,161 @@
 
 """SQLAlchemy-specific utility functions for type mapping and join condition building."""
 
-from typing import Type
-
-from sqlalchemy import String, Integer, Float, Boolean, DateTime, Date, Text, Numeric
+import sys
+from typing import Optional, Type
+
+from sqlalchemy import (
+    String,
+    Integer,
+    Float,
+    Boolean,
+    DateTime,
+    Date,
+    Text,
+    Numeric,
+    UniqueConstraint,
+)
 
 from semantido.generators.utils.time_grain import normalize_time_grain
 
+##### Class Namespace
+
+
+def semantic_namespace(clazz: Type) -> dict:
+    """
+    Flattens the attributes visible on a mapped class into a single dict.
+
+    Semantic annotations are plain class attributes, possibly inherited from
+    a mixin or base. Merging the MRO namespaces once per class (most-derived
+    last, so overrides win as with ``getattr``) turns every subsequent
+    metadata lookup into one dict access instead of an attribute walk.
+
+    Args:
+        clazz: The Python class representing the model.
+
+    Returns:
+        dict: Attribute name to value, as ``getattr`` would resolve them.
+    """
+    namespace: dict = {}
+    for base in reversed(clazz.__mro__[:-1]):  # ``object`` carries no metadata
+        namespace.update(vars(base))
+    return namespace
+
+
 ##### Table Metadata Extraction
 
 
-def extract_table_metadata(clazz: Type, table_name: str) -> dict:
+def extract_table_metadata(
+    clazz: Type, table_name: str, namespace: Optional[dict] = None
+) -> dict:
     """
     Reads semantic metadata attributes from a mapped class.
 
     Args:
         clazz: The Python class representing the model.
         table_name: The physical table name, used as a fallback description.
+        namespace: The class namespace from ``semantic_namespace``; built
+            on demand when omitted.
 
     Returns:
         dict: A dictionary of semantic metadata fields.
     """
+    attrs = semantic_namespace(clazz) if namespace is None else namespace
     return {
-        "description": getattr(
-            clazz, "__semantic_description__", f"Table: {table_name}"
-        ),
-        "synonyms": getattr(clazz, "__semantic_synonyms__", None) or [],
-        "sql_filters": getattr(clazz, "__semantic_sql_filters__", None) or [],
-        "application_context": getattr(clazz, "__semantic_application_context__", None),
-        "business_context": getattr(clazz, "__semantic_business_context__", None),
-        "time_dimension": getattr(clazz, "__semantic_time_dimension__", None),
-        "concept": getattr(clazz, "__semantic_concept__", None),
+        "description": attrs.get("__semantic_description__", f"Table: {table_name}"),
+        "synonyms": attrs.get("__semantic_synonyms__") or [],
+        "sql_filters": attrs.get("__semantic_sql_filters__") or [],
+        "application_context": attrs.get("__semantic_application_context__"),
+        "business_context": attrs.get("__semantic_business_context__"),
+        "time_dimension": attrs.get("__semantic_time_dimension__"),
+        "concept": attrs.get("__semantic_concept__"),
     }
 
 
+def extract_unique_keys(mapper, primary_key) -> list[list[str]] | None:
+    """Extracts unique constraints and unique indexes as key column lists.
+
+    Covers ``UniqueConstraint`` in ``__table_args__``, the implicit
+    constraint created by ``Column(unique=True)``, and ``Index(...,
+    unique=True)``. The primary key is excluded (it is already declared
+    via ``primary_key``), duplicates are collapsed, and the result is
+    sorted for deterministic output.
+
+    Declaring these matters downstream: Apache Ossie cardinality inference
+    (Foundation section 6.4) treats join columns with no declared key as
+    worst-case N:N, so dropping a unique key silently restricts the
+    query surface of every relationship targeting those columns.
+
+    Args:
+        mapper: The SQLAlchemy Mapper object of the mapped class.
+        primary_key: The primary key column names, excluded from the result.
+
+    Returns:
+        list[list[str]] | None: One list of column names per unique key,
+        or None when the table declares none.
+    """
+    table = mapper.persist_selectable
+    keys: set[tuple[str, ...]] = set()
+
+    for constraint in getattr(table, "constraints", ()):
+        if isinstance(constraint, UniqueConstraint):
+            keys.add(tuple(col.name for col in constraint.columns))
+
+    for index in getattr(table, "indexes", ()):
+        if getattr(index, "unique", False):
+            keys.add(tuple(col.name for col in index.columns))
+
+    if primary_key:
+        keys.discard(tuple(primary_key))
+
+    return [list(key) for key in sorted(keys)] or None
+
+
 ##### Column Metadata Extraction
 
 
-def extract_column_metadata(clazz: Type, column_name: str) -> dict:
+def extract_column_metadata(
+    clazz: Type, column_name: str, namespace: Optional[dict] = None
+) -> dict:
     """
     Reads semantic metadata attributes from a mapped class for a specific column.
 
     Args:
         clazz: The model class where the column is defined.
         column_name: The name of the column attribute.
+        namespace: The class namespace from ``semantic_namespace``; built
+            on demand when omitted.
 
     Returns:
         dict: A dictionary of semantic metadata fields for the column.
     """
+    attrs = semantic_namespace(clazz) if namespace is None else namespace
+    # Keys are built by plain concatenation; the fallback description is
+    # only formatted for columns that do not declare one.
+    description_key = column_name + "_description"
     return {
-        "description": getattr(
-            clazz, f"{column_name}_description", f"Column: {column_name}"
-        ),
-        "privacy_level": getattr(clazz, f"{column_name}_privacy_level", None),
-        "sample_values": getattr(clazz, f"{column_name}_sample_values", None),
-        "synonyms": getattr(clazz, f"{column_name}_synonyms", []),
-        "application_rules": getattr(clazz, f"{column_name}_application_rules", []),
-        "is_time_dimension": bool(
-            getattr(clazz, f"{column_name}_is_time_dimension", False)
+        "description": (
+            attrs[description_key]
+            if description_key in attrs
+            else f"Column: {column_name}"
         ),
+        "privacy_level": attrs.get(column_name + "_privacy_level"),
+        "sample_values": attrs.get(column_name + "_sample_values"),
+        "synonyms": attrs.get(column_name + "_synonyms", []),
+        "application_rules": attrs.get(column_name + "_application_rules", []),
+        "is_time_dimension": bool(attrs.get(column_name + "_is_time_dimension")),
         "time_grain": normalize_time_grain(
-            clazz, column_name, getattr(clazz, f"{column_name}_time_grain", None)
+            clazz, column_name, attrs.get(column_name + "_time_grain")
         ),
-        "concept": getattr(clazz, f"{column_name}_concept", None),
+        "concept": attrs.get(column_name + "_concept"),
     }
 
 
+def _qualified_name(table) -> str:
+    """Returns ``schema.table`` when the table has a schema, else ``table``."""
+    return f"{table.schema}.{table.name}" if table.schema else table.name
+
+
 def resolve_foreign_key(sql_column_meta) -> tuple[bool, str | None]:
     """
     Resolves foreign key information from an SQLAlchemy column.
@@ -89,17 +179,30 @@ def resolve_foreign_key(sql_column_meta) -> tuple[bool, str | None]:
     Returns:
         tuple: (is_foreign_key, references) where references are 'table.column' or None.
     """
-    is_fk = len(sql_column_meta.foreign_keys) > 0
-    if not is_fk:
+    fk = next(iter(sql_column_meta.foreign_keys), None)
+    if fk is None:
         return False, None
 
-    fk = list(sql_column_meta.foreign_keys)[0]
-    table_ref = (
-        f"{fk.column.table.schema}.{fk.column.table.name}"
-        if fk.column.table.schema
-        else fk.column.table.name
-    )
-    return True, f"{table_ref}.{fk.column.name}"
+    return True, f"{_qualified_name(fk.column.table)}.{fk.column.name}"
+
+
+# SQLAlchemy type -> Postgres type, most-derived first: subclass checks
+# take the first match, and Text subclasses String, Float subclasses Numeric.
+_TYPE_MAPPING: tuple[tuple[type, str], ...] = (
+    (Text, "TEXT"),
+    (String, "VARCHAR"),
+    (Integer, "INTEGER"),
+    (Float, "FLOAT"),
+    (Numeric, "DECIMAL"),
+    (Boolean, "BOOLEAN"),
+    (DateTime, "TIMESTAMP"),
+    (Date, "DATE"),
+)
+
+# Resolved Postgres type name per SQLAlchemy type class. The mapping only
+# depends on the class, so each distinct class walks the mapping once.
+# None marks a class with no mapping, which renders from its instance.
+_TYPE_CACHE: dict[type, Optional[str]] = {}
 
 
 def map_sqlalchemy_type(sql_type) -> str:
@@ -112,22 +215,24 @@ def map_sqlalchemy_type(sql_type) -> str:
     Returns:
         str: A Postgres standardized type name (e.g., "INTEGER", "VARCHAR").
     """
-    type_mapping = {
-        Text: "TEXT",
-        String: "VARCHAR",
-        Integer: "INTEGER",
-        Float: "FLOAT",
-        Numeric: "DECIMAL",
-        Boolean: "BOOLEAN",
-        DateTime: "TIMESTAMP",
-        Date: "DATE",
-    }
-
-    for sqlalchemy_type, pg_type in type_mapping.items():
-        if isinstance(sql_type, sqlalchemy_type):
-            return pg_type
+    type_class = type(sql_type)
+    try:
+        pg_type = _TYPE_CACHE[type_class]
+    except KeyError:
+        pg_type = _TYPE_CACHE[type_class] = next(
+            (
+                mapped
+                for sqlalchemy_type, mapped in _TYPE_MAPPING
+                if issubclass(type_class, sqlalchemy_type)
+            ),
+            None,
+        )
 
-    return str(sql_type)
+    # Unmapped types render from the instance (a TypeDecorator renders its
+    # parameterized impl), so only the miss itself is cached by class. The
+    # rendered name is interned so columns of one such type share it, as
+    # mapped types share their constant names.
+    return sys.intern(str(sql_type)) if pg_type is None else pg_type
 
 
 def build_join_condition(relationship_meta) -> str:
@@ -147,32 +252,17 @@ def build_join_condition(relationship_meta) -> str:
     Raises:
         ValueError: If no local/remote column pairs are found.
     """
-    local_cols = []
-    remote_cols = []
-
-    for local, remote in relationship_meta.local_remote_pairs:
-        local_table = (
-            f"{local.table.schema}.{local.table.name}"
-            if local.table.schema
-            else local.table.name
-        )
-        remote_table = (
-            f"{remote.table.schema}.{remote.table.name}"
-            if remote.table.schema
-            else remote.table.name
-        )
-        local_cols.append(f"{local_table}.{local.name}")
-        remote_cols.append(f"{remote_table}.{remote.name}")
-
-    conditions = [
-        f"{local} = {remote}" for local, remote in zip(local_cols, remote_cols)
-    ]
+    condition = " AND ".join(
+        f"{_qualified_name(local.table)}.{local.name} = "
+        f"{_qualified_name(remote.table)}.{remote.name}"
+        for local, remote in relationship_meta.local_remote_pairs
+    )
 
-    if not conditions:
+    if not condition:
         raise ValueError(
             f"Could not determine join condition for relationship "
             f"'{relationship_meta.key}': no local/remote column pairs found. "
             "Check if the relationship uses a secondary table or a custom primary join."
         )
 
-    return " AND ".join(conditions)
+    return condition
@@ -14,7 +14,7 @@
 
 """Provides the base mixin for integrating SQLAlchemy models with the semantic layer."""
 
-from typing import ClassVar, Optional
+from typing import ClassVar, Iterable, Optional
 
 from semantido.generators.semantic_bridge import SQLAlchemySemanticBridge
 from semantido.generators.concept_registry import ConceptRegistry
@@ -48,19 +48,22 @@ class SemanticBase:
         Retrieves or initializes the `SQLAlchemySemanticBridge` for this base class.
 
         This method performs a lazy initialization of the bridge by traversing
-        the Method Resolution Order (MRO) to find the SQLAlchemy registry.
+        the Method Resolution Order (MRO) to find the class that owns the
+        SQLAlchemy registry. The bridge is stored on that class, so the base
+        and every model mapped into its registry share a single bridge (and
+        its cached layer), whichever of them asks first.
 
         Returns:
             SQLAlchemySemanticBridge: The bridge instance associated with this model hierarchy.
         """
-
-        if hasattr(cls, "_semantic_bridge"):
-            return cls._semantic_bridge
-
         for base in cls.__mro__:
-            if hasattr(base, "registry"):
-                cls._semantic_bridge = SQLAlchemySemanticBridge(base)
-                return cls._semantic_bridge
+            namespace = vars(base)
+            if "registry" in namespace:
+                bridge = namespace.get("_semantic_bridge")
+                if bridge is None:
+                    bridge = SQLAlchemySemanticBridge(base)
+                    setattr(base, "_semantic_bridge", bridge)
+                return bridge
 
         raise RuntimeError(
             "SemanticBase requires a SQLAlchemy declarative base registry"
@@ -68,24 +71,42 @@ class SemanticBase:
 
     @classmethod
     def sync_semantic_layer(
-        cls, concept_registry: Optional[ConceptRegistry] = None
+        cls,
+        concept_registry: Optional[ConceptRegistry] = None,
+        only: Optional[Iterable[str]] = None,
     ) -> SemanticLayer:
         """
         Synchronizes the semantic layer with the current state of all mapped models.
 
-        This method clears existing semantic metadata and re-extracts all tables,
-        columns, and relationships from the SQLAlchemy registry.
+        This method re-extracts all tables, columns, and relationships from the
+        SQLAlchemy registry, unless the set of mapped models is unchanged since
+        the last sync, in which case the cached extraction is reused. Either
+        way a new layer of copies is returned, safe to filter per request.
 
         Args:
             concept_registry: Optional concept registry; when provided,
                 concept references declared on models are validated
                 against it, and the registry travels with the layer
                 into exporters.
+            only: Optional table names to limit the sync to, e.g.
+                ``["products"]``; ``None`` syncs every mapped model.
 
         Returns:
             SemanticLayer: The updated semantic layer containing the synchronized metadata.
         """
         bridge = cls.get_semantic_bridge()
-        semantic_layer = bridge.sync_from_models(concept_registry=concept_registry)
+        semantic_layer = bridge.sync_from_models(
+            concept_registry=concept_registry, only=only
+        )
 
         return semantic_layer
+
+    @classmethod
+    def invalidate_semantic_layer(cls) -> None:
+        """
+        Forces the next `sync_semantic_layer` call to re-extract every model.
+
+        The cached extraction is reused while the same models are mapped. Call
+        this after changing semantic annotations on an already-mapped class.
+        """
+        cls.get_semantic_bridge().invalidate()
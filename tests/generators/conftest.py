@@ -1,8 +1,8 @@
 import pytest
 from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import DeclarativeBase, relationship
 
-from semantido import semantic_table, SemanticDeclarativeBase
+from semantido import semantic_table, SemanticBase, SemanticDeclarativeBase
 from semantido.generators.semantic_layer import PrivacyLevel
 
 
@@ -47,3 +47,13 @@ class Post(SemanticDeclarativeBase):
 def models():
     """Fixture providing the test models."""
     return {"User": User, "Post": Post}
+
+
+@pytest.fixture
+def isolated_base():
+    """Fixture providing a fresh semantic base with its own registry."""
+
+    class Base(SemanticBase, DeclarativeBase):
+        """Isolated registry for one test."""
+
+    return Base
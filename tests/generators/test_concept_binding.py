@@ -97,6 +97,8 @@ def _build_models():
         counterparty = SAColumn(String)
         counterparty_concept = "counterparty_mifir"
 
+    # the registry holds mapped classes weakly; keep them alive for the test
+    Base.test_models = (EmirTradeState, MifirTransaction)
     return Base
 
 
@@ -159,6 +161,17 @@ class TestSync:
         with pytest.raises(ValueError, match="emir_trade_state.counterparty"):
             base.sync_semantic_layer(concept_registry=registry)
 
+    def test_registry_edited_in_place_is_revalidated(self):
+        base = _build_models()
+        registry = _registry()
+        base.sync_semantic_layer(concept_registry=registry)
+        # same registry object, edited after a successful sync
+        registry.concepts["counterparty_emir"].relations.clear()
+        registry.concepts["counterparty_mifir"].relations.clear()
+        del registry.concepts["counterparty_emir"]
+        with pytest.raises(ValueError, match="emir_trade_state.counterparty"):
+            base.sync_semantic_layer(concept_registry=registry)
+
     def test_sync_without_registry_unchanged(self):
         base = _build_models()
         layer = base.sync_semantic_layer()
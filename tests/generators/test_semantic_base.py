@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from semantido import SemanticDeclarativeBase
 
 
@@ -12,3 +15,15 @@ def test_semantic_base(models):
 
     assert "users" in semantic_layer.tables
     assert "posts" in semantic_layer.tables
+
+
+def test_package_import_defers_sqlalchemy():
+    """Importing the package alone does not load SQLAlchemy; the bases load it on access."""
+    script = (
+        "import sys, semantido\n"
+        "assert 'sqlalchemy' not in sys.modules\n"
+        "assert 'SemanticBase' in dir(semantido)\n"
+        "from semantido import SemanticBase\n"
+        "assert 'sqlalchemy' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -1,4 +1,9 @@
-from sqlalchemy import Column, Integer
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy.orm import DeclarativeBase, relationship
+
+from semantido import SemanticBase, semantic_table
+from semantido.generators import semantic_bridge
 from semantido.models.declarative_base import SemanticDeclarativeBase
 from semantido.generators.semantic_layer import PrivacyLevel, RelationshipType
 from semantido.exporters.json_exporter import to_json
@@ -56,3 +61,351 @@ def test_to_json_export():
 
     parsed = _json.loads(json_data)
     assert parsed["tables"]["users"]["primary_key"] == ["id"]
+
+
+def test_sync_reuses_layer_while_registry_unchanged(monkeypatch, isolated_base):
+    """Repeated syncs against an unchanged registry skip re-extraction."""
+
+    class First(isolated_base):
+        __tablename__ = "first"
+        id = Column(Integer, primary_key=True)
+
+    calls = []
+    extract = semantic_bridge._extract_table
+    monkeypatch.setattr(
+        semantic_bridge,
+        "_extract_table",
+        lambda clazz, *args: calls.append(clazz) or extract(clazz, *args),
+    )
+
+    bridge = isolated_base.get_semantic_bridge()
+    layer = bridge.sync_from_models()
+    assert bridge.sync_from_models() == layer
+    assert calls == [First]
+
+    class Second(isolated_base):
+        __tablename__ = "second"
+        id = Column(Integer, primary_key=True)
+
+    # a newly mapped model changes the fingerprint and forces a rebuild
+    assert list(bridge.sync_from_models().tables) == ["first", "second"]
+    assert len(calls) == 3
+
+
+def test_cached_syncs_hand_out_independent_layers(isolated_base):
+    """Filtering one synced layer in place never leaks into the next sync."""
+
+    class Client(isolated_base):
+        __tablename__ = "clients"
+        id = Column(Integer, primary_key=True)
+        tax_id = Column(String(20))
+        tax_id_privacy_level = PrivacyLevel.CONFIDENTIAL
+
+    layer = isolated_base.sync_semantic_layer()
+    table = layer.tables["clients"]
+    table.columns = [
+        c for c in table.columns if c.privacy_level != PrivacyLevel.CONFIDENTIAL
+    ]
+    table.primary_key.clear()
+    layer.relationships = []
+
+    again = isolated_base.sync_semantic_layer()
+    assert again is not layer
+    assert [c.name for c in again.tables["clients"].columns] == ["id", "tax_id"]
+    assert again.tables["clients"].primary_key == ["id"]
+
+    layer.tables = {}
+    assert list(isolated_base.sync_semantic_layer().tables) == ["clients"]
+
+
+def test_cached_syncs_copy_list_fields(isolated_base):
+    """Appending to a synced list field reaches neither the cache nor the model."""
+
+    class Client(isolated_base):
+        __tablename__ = "clients"
+        id = Column(Integer, primary_key=True)
+        id_synonyms = ["client id"]
+
+    column = isolated_base.sync_semantic_layer().tables["clients"].columns[0]
+    column.synonyms.append("customer number")
+    column.application_rules.append("never null")
+
+    again = isolated_base.sync_semantic_layer().tables["clients"].columns[0]
+    assert again.synonyms == ["client id"] and again.application_rules == []
+    assert Client.id_synonyms == ["client id"]
+
+
+def test_application_glossary_survives_resync(isolated_base):
+    """The glossary is authored on the layer and carries into the next sync."""
+
+    class Client(isolated_base):
+        __tablename__ = "clients"
+        id = Column(Integer, primary_key=True)
+
+    layer = isolated_base.sync_semantic_layer()
+    layer.application_glossary["UTI"] = "Unique Transaction Identifier"
+
+    again = isolated_base.sync_semantic_layer()
+    assert again.application_glossary == {"UTI": "Unique Transaction Identifier"}
+    assert again.application_glossary is not layer.application_glossary
+    bridge = isolated_base.get_semantic_bridge()
+    assert bridge.get_semantic_layer().application_glossary == {
+        "UTI": "Unique Transaction Identifier"
+    }
+
+
+def test_caching_schema_freezes_fingerprint(isolated_base):
+    """Inside caching_schema, models mapped mid-block are not picked up."""
+
+    class Early(isolated_base):
+        __tablename__ = "early"
+        id = Column(Integer, primary_key=True)
+
+    bridge = isolated_base.get_semantic_bridge()
+    with bridge.caching_schema():
+        assert list(bridge.sync_from_models().tables) == ["early"]
+
+        class Late(isolated_base):
+            __tablename__ = "late"
+            id = Column(Integer, primary_key=True)
+
+        assert list(bridge.sync_from_models().tables) == ["early"]
+
+    assert list(bridge.sync_from_models().tables) == ["early", "late"]
+
+
+def test_column_metadata_inherited_from_mixin(isolated_base):
+    """Annotations on a mixin resolve like getattr: subclass values win."""
+
+    class AuditMixin:
+        created_by_description = "Login of the user who created the row"
+        created_by_privacy_level = PrivacyLevel.INTERNAL
+        note_description = "Mixin default"
+
+    class Invoice(AuditMixin, isolated_base):
+        __tablename__ = "invoices"
+        id = Column(Integer, primary_key=True)
+        created_by = Column(String(50))
+        note = Column(String(200))
+        note_description = "Free-text note on the invoice"
+
+    columns = {
+        c.name: c
+        for c in isolated_base.sync_semantic_layer().tables["invoices"].columns
+    }
+    assert columns["created_by"].description == "Login of the user who created the row"
+    assert columns["created_by"].privacy_level == PrivacyLevel.INTERNAL
+    assert columns["note"].description == "Free-text note on the invoice"
+
+
+def test_rebuild_reuses_join_conditions(monkeypatch, isolated_base):
+    """A rebuild caused by a new model does not rebuild existing joins."""
+
+    class Owner(isolated_base):
+        __tablename__ = "owners"
+        id = Column(Integer, primary_key=True)
+        pets = relationship("Pet", back_populates="owner")
+
+    class Pet(isolated_base):
+        __tablename__ = "pets"
+        id = Column(Integer, primary_key=True)
+        owner_id = Column(Integer, ForeignKey("owners.id"))
+        owner = relationship("Owner", back_populates="pets")
+
+    built = []
+    build = semantic_bridge.build_join_condition
+    monkeypatch.setattr(
+        semantic_bridge,
+        "build_join_condition",
+        lambda rel: built.append(rel.key) or build(rel),
+    )
+
+    bridge = isolated_base.get_semantic_bridge()
+    first = {r.join_condition for r in bridge.sync_from_models().relationships}
+    assert sorted(built) == ["owner", "pets"]
+
+    class Vet(isolated_base):
+        __tablename__ = "vets"
+        id = Column(Integer, primary_key=True)
+
+    layer = bridge.sync_from_models()
+    assert "vets" in layer.tables
+    assert {r.join_condition for r in layer.relationships} == first
+    assert sorted(built) == ["owner", "pets"]
+
+
+def test_failed_rebuild_keeps_previous_layer(isolated_base):
+    """An extraction error does not leave the layer half-cleared."""
+
+    class Good(isolated_base):
+        __tablename__ = "good"
+        id = Column(Integer, primary_key=True)
+
+    layer = isolated_base.sync_semantic_layer()
+
+    @semantic_table(description="Broken time axis", time_dimension="missing")
+    class Broken(isolated_base):
+        __tablename__ = "broken"
+        id = Column(Integer, primary_key=True)
+
+    with pytest.raises(RuntimeError, match="Broken"):
+        isolated_base.sync_semantic_layer()
+    assert list(layer.tables) == ["good"]
+
+
+def test_rebuild_reuses_column_metadata(monkeypatch, isolated_base):
+    """Unchanged models' columns are not re-read when another model is added."""
+
+    class Account(isolated_base):
+        __tablename__ = "accounts"
+        id = Column(Integer, primary_key=True)
+        iban = Column(String(34))
+        iban_description = "International bank account number"
+
+    read = []
+    extract = semantic_bridge.extract_column_metadata
+    monkeypatch.setattr(
+        semantic_bridge,
+        "extract_column_metadata",
+        lambda clazz, name, *args: read.append(name) or extract(clazz, name, *args),
+    )
+
+    bridge = isolated_base.get_semantic_bridge()
+    first = bridge.sync_from_models().tables["accounts"].columns
+    assert sorted(read) == ["iban", "id"]
+
+    class Branch(isolated_base):
+        __tablename__ = "branches"
+        id = Column(Integer, primary_key=True)
+
+    columns = bridge.sync_from_models().tables["accounts"].columns
+    assert sorted(read) == ["iban", "id", "id"]  # only Branch.id is new
+    assert columns == first and columns[0] is not first[0]
+
+
+def test_undeclared_list_annotations_default_to_fresh_lists(isolated_base):
+    """Missing synonyms and rules are appendable lists that export as absent."""
+
+    class Ledger(isolated_base):
+        __tablename__ = "ledgers"
+        id = Column(Integer, primary_key=True)
+        code = Column(String(8))
+
+    layer = isolated_base.sync_semantic_layer()
+    table = layer.tables["ledgers"]
+    id_column, code_column = table.columns
+
+    assert table.synonyms == [] and table.sql_filters == []
+    id_column.synonyms.append("ledger id")
+    assert code_column.synonyms == [] and table.synonyms == []
+
+    exported = layer.to_dict()["tables"]["ledgers"]
+    assert "synonyms" not in exported and "sql_filters" not in exported
+    assert "synonyms" not in exported["columns"][1]
+
+    full = layer.to_dict(include_empty=True)["tables"]["ledgers"]
+    assert full["sql_filters"] == [] and full["columns"][1]["application_rules"] == []
+
+
+def test_invalidate_picks_up_edited_annotations(isolated_base):
+    """Edits to a mapped class are invisible to the cache until invalidated."""
+
+    class Desk(isolated_base):
+        __tablename__ = "desks"
+        id = Column(Integer, primary_key=True)
+        id_description = "Desk identifier"
+
+    bridge = isolated_base.get_semantic_bridge()
+    bridge.sync_from_models()
+    Desk.id_description = "Trading desk identifier"
+
+    assert bridge.sync_from_models().tables["desks"].columns[0].description == (
+        "Desk identifier"
+    )
+    isolated_base.invalidate_semantic_layer()
+    rebuilt = bridge.sync_from_models()
+    assert rebuilt.tables["desks"].columns[0].description == "Trading desk identifier"
+
+
+def test_models_share_the_registry_owners_bridge(isolated_base):
+    """Asking a model first still yields the one bridge stored on the base."""
+
+    class Other(SemanticBase, DeclarativeBase):
+        """A second, independent registry."""
+
+    class Fund(isolated_base):
+        __tablename__ = "funds"
+        id = Column(Integer, primary_key=True)
+
+    bridge = Fund.get_semantic_bridge()
+    assert bridge.base is isolated_base
+    assert isolated_base.get_semantic_bridge() is bridge
+    assert "_semantic_bridge" not in vars(Fund)
+    assert Other.get_semantic_bridge() is not bridge
+
+
+def test_relationship_endpoints_share_interned_table_names(models):
+    """Table keys and relationship endpoints naming one table are one string."""
+    layer = SemanticDeclarativeBase.sync_semantic_layer()
+    users_key = next(name for name in layer.tables if name == "users")
+    endpoints = [
+        name
+        for rel in layer.relationships
+        for name in (rel.from_table, rel.to_table)
+        if name == "users"
+    ]
+    assert endpoints and all(name is users_key for name in endpoints)
+
+
+def test_relationship_description_inherited_from_mixin(isolated_base):
+    """Relationship descriptions resolve through the merged class namespace."""
+
+    class Owned:
+        owner_relationship_description = "Account holder of the record"
+
+    class Holder(isolated_base):
+        __tablename__ = "holders"
+        id = Column(Integer, primary_key=True)
+
+    class Wallet(Owned, isolated_base):
+        __tablename__ = "wallets"
+        id = Column(Integer, primary_key=True)
+        holder_id = Column(Integer, ForeignKey("holders.id"))
+        owner = relationship(Holder)
+
+    (rel,) = isolated_base.sync_semantic_layer().relationships
+    assert rel.description == "Account holder of the record"
+
+
+def test_sync_limited_to_subset_of_tables(isolated_base):
+    """``only`` restricts the returned layer and leaves the full sync alone."""
+
+    class Holder(isolated_base):
+        __tablename__ = "holders"
+        id = Column(Integer, primary_key=True)
+
+    class Wallet(isolated_base):
+        __tablename__ = "wallets"
+        id = Column(Integer, primary_key=True)
+        holder_id = Column(Integer, ForeignKey("holders.id"))
+        owner = relationship(Holder)
+
+    subset = isolated_base.sync_semantic_layer(only=["wallets"])
+    assert list(subset.tables) == ["wallets"]
+    assert subset.relationships == []
+
+    full = isolated_base.sync_semantic_layer()
+    assert list(full.tables) == ["holders", "wallets"]
+    assert len(full.relationships) == 1
+
+    with pytest.raises(ValueError, match="accounts"):
+        isolated_base.sync_semantic_layer(only=["accounts"])
+
+    # a subset of an already-synced registry is a new layer, not a rewrite
+    again = isolated_base.sync_semantic_layer(only=["wallets"])
+    assert again is not full and list(again.tables) == ["wallets"]
+    assert list(full.tables) == ["holders", "wallets"]
+    assert isolated_base.get_semantic_bridge().get_semantic_layer() is full
+
+    with pytest.raises(TypeError, match=r"\['wallets'\]"):
+        isolated_base.sync_semantic_layer(only="wallets")
@@ -7,8 +7,10 @@ from semantido.generators.semantic_layer import (
     Relationship,
     PrivacyLevel,
     RelationshipType,
+    TimeGrain,
 )
 from semantido.exporters import to_json, to_json_file
+from semantido.generators.concept_registry import ConceptRegistry
 
 
 @pytest.fixture
@@ -107,9 +109,140 @@ def test_semantic_layer_persistence(complex_semantic_layer, tmp_path):
         assert data["tables"]["users"]["name"] == "users"
 
 
+def test_json_indent_is_opt_out(complex_semantic_layer, tmp_path):
+    """indent=None writes compact single-line JSON with the same content."""
+    compact = to_json(complex_semantic_layer, indent=None)
+    assert "\n" not in compact
+    assert json.loads(compact) == json.loads(to_json(complex_semantic_layer))
+
+    output_file = tmp_path / "compact.json"
+    to_json_file(complex_semantic_layer, str(output_file), indent=None)
+    assert output_file.read_text(encoding="utf-8") == compact
+
+
 def test_empty_semantic_layer():
     """Verify the behavior of a fresh, empty layer."""
     sl = SemanticLayer()
     result = sl.to_dict()
     assert result["tables"] == {}
     assert result["relationships"] == []
+
+
+def test_empty_tuples_pruned_in_dicts_and_lists():
+    """Empty tuples count as empty whether they are values or list items."""
+    pruned = SemanticLayer._remove_empty_values({"a": (), "b": [(), [], "x"]})
+    assert pruned == {"b": ["x"]}
+
+
+def test_iter_columns_flattens_tables(complex_semantic_layer):
+    """iter_columns yields every column with its owning table, in order."""
+    pairs = [
+        (table.name, column.name)
+        for table, column in complex_semantic_layer.iter_columns()
+    ]
+    assert pairs == [("users", "id"), ("users", "email")]
+    confidential = [
+        column.name
+        for _, column in complex_semantic_layer.iter_columns()
+        if column.privacy_level is PrivacyLevel.CONFIDENTIAL
+    ]
+    assert confidential == ["email"]
+
+
+def test_bulk_load_replaces_tables_and_relationships(complex_semantic_layer):
+    """bulk_load swaps in new collections instead of mutating the old ones."""
+    old_tables = complex_semantic_layer.tables
+    orders = Table(name="orders", description="Orders", columns=[], primary_key=None)
+
+    complex_semantic_layer.bulk_load([orders], [])
+
+    assert list(complex_semantic_layer.tables) == ["orders"]
+    assert complex_semantic_layer.relationships == []
+    assert "users" in old_tables
+
+
+def test_layer_dataclasses_are_slotted(complex_semantic_layer):
+    """Fields stay mutable, but undeclared attributes are rejected."""
+    column = complex_semantic_layer.tables["users"].columns[0]
+    column.description = "Primary identifier"
+    assert not hasattr(column, "__dict__")
+    with pytest.raises(AttributeError):
+        column.descripton = "typo"
+
+
+def test_enum_fields_accept_their_values():
+    """String values are coerced to enum members at construction."""
+    column = Column(
+        name="booked_at",
+        data_type="TIMESTAMP",
+        description="Booking time",
+        privacy_level="internal",
+        time_grain="day",
+    )
+    rel = Relationship(
+        from_table="orders",
+        to_table="users",
+        join_condition="orders.user_id = users.id",
+        relationship_type="many-to-one",
+        description="Links orders to customers",
+    )
+    assert column.privacy_level is PrivacyLevel.INTERNAL
+    assert column.time_grain is TimeGrain.DAY
+    assert rel.relationship_type is RelationshipType.MANY_TO_ONE
+    with pytest.raises(ValueError):
+        Column(name="x", data_type="TEXT", description="", privacy_level="secret")
+
+
+def test_enum_fields_assigned_raw_values_still_serialize(complex_semantic_layer):
+    """Values assigned after construction skip coercion but still export."""
+    column = complex_semantic_layer.tables["users"].columns[0]
+    column.privacy_level = "public"
+    column.time_grain = "day"
+    complex_semantic_layer.relationships[0].relationship_type = "many-to-one"
+
+    data = complex_semantic_layer.to_dict()
+    assert data["tables"]["users"]["columns"][0]["privacy_level"] == "public"
+    assert data["tables"]["users"]["columns"][0]["time_grain"] == "day"
+    assert data["relationships"][0]["relationship_type"] == "many-to-one"
+
+
+def test_concepts_precede_absent_relationships_in_key_order(complex_semantic_layer):
+    """Pruned exports keep the historical top-level key order."""
+    registry = ConceptRegistry()
+    registry.concept("customer", "A person or firm holding an account")
+    complex_semantic_layer.concept_registry = registry
+    complex_semantic_layer.relationships = []
+
+    assert list(complex_semantic_layer.to_dict()) == [
+        "tables",
+        "concepts",
+        "relationships",
+    ]
+    assert list(complex_semantic_layer.to_dict(include_empty=True)) == [
+        "tables",
+        "relationships",
+        "concepts",
+    ]
+
+
+def test_relationships_by_source_keeps_parallel_links(complex_semantic_layer):
+    """Links between the same table pair are grouped, not collapsed."""
+    second = Relationship(
+        from_table="orders",
+        to_table="users",
+        join_condition="orders.approver_id = users.id",
+        relationship_type=RelationshipType.MANY_TO_ONE,
+        description="Links orders to their approver",
+    )
+    complex_semantic_layer.add_relationship(second)
+
+    by_source = complex_semantic_layer.relationships_by_source()
+    assert list(by_source) == ["orders"]
+    assert by_source["orders"] == complex_semantic_layer.relationships
+
+
+def test_get_column_by_name(complex_semantic_layer):
+    """get_column returns the named column, or None when it is absent."""
+    users = complex_semantic_layer.tables["users"]
+    assert users.get_column("email") is users.columns[1]
+    assert users.get_column("missing") is None
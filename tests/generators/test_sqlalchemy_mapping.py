@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKeyConstraint,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    Unicode,
+    UnicodeText,
+)
+from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.types import TypeDecorator, VARBINARY
+
+from semantido.generators.utils import build_join_condition, map_sqlalchemy_type
+from semantido.generators.utils.sqlalchemy_mapping import _TYPE_CACHE
+
+
+@pytest.mark.parametrize(
+    "sql_type, expected",
+    [
+        (String(50), "VARCHAR"),
+        (Unicode(50), "VARCHAR"),
+        (Text(), "TEXT"),
+        (UnicodeText(), "TEXT"),
+        (Integer(), "INTEGER"),
+        (Float(), "FLOAT"),
+        (Numeric(10, 2), "DECIMAL"),
+        (Boolean(), "BOOLEAN"),
+        (DateTime(), "TIMESTAMP"),
+        (Date(), "DATE"),
+    ],
+)
+def test_map_sqlalchemy_type(sql_type, expected):
+    """Subclasses map like their base; repeat lookups hit the class cache."""
+    _TYPE_CACHE.pop(type(sql_type), None)
+    assert map_sqlalchemy_type(sql_type) == expected
+    assert _TYPE_CACHE[type(sql_type)] == expected
+    assert map_sqlalchemy_type(sql_type) == expected
+
+
+class _Digest(TypeDecorator):
+    impl = VARBINARY
+    cache_ok = True
+
+
+def test_unmapped_type_renders_per_instance():
+    """Unmapped types cache only the miss by class: parameters still render."""
+    assert map_sqlalchemy_type(_Digest(16)) == "VARBINARY(16)"
+    assert map_sqlalchemy_type(_Digest(32)) == "VARBINARY(32)"
+    assert map_sqlalchemy_type(_Digest(16)) is map_sqlalchemy_type(_Digest(16))
+
+
+def test_join_condition_composite_and_schema_qualified():
+    """Every column pair is joined, with schema-qualified table names."""
+
+    class Base(DeclarativeBase):
+        """Isolated registry for this test."""
+
+    class Product(Base):
+        __tablename__ = "products"
+        __table_args__ = {"schema": "catalog"}
+        store_id = Column(Integer, primary_key=True)
+        product_id = Column(Integer, primary_key=True)
+
+    class Sale(Base):
+        __tablename__ = "sales"
+        __table_args__ = (
+            ForeignKeyConstraint(
+                ["store_id", "product_id"],
+                ["catalog.products.store_id", "catalog.products.product_id"],
+            ),
+        )
+        id = Column(Integer, primary_key=True)
+        store_id = Column(Integer)
+        product_id = Column(Integer)
+        product = relationship(Product)
+
+    condition = build_join_condition(Sale.__mapper__.relationships["product"])
+    assert condition == (
+        "sales.store_id = catalog.products.store_id AND "
+        "sales.product_id = catalog.products.product_id"
+    )